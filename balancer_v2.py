@@ -3,8 +3,13 @@ V2 from Google Exp 1206
 """
 
 import asyncio
+import logging
+import time
 from decimal import Decimal
 from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import aiohttp
 
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.settings import GatewayConnectionSetting
@@ -13,8 +18,12 @@ from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
+# Bound once so the per-tick paths skip the enum attribute lookups
+_BUY = TradeType.BUY
+_SELL = TradeType.SELL
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TradeParams:
     """
     Handles data locally
@@ -25,7 +34,6 @@ class TradeParams:
     connector: str
     base: str
     quote: str
-    address: str = None  # Optional, to be set later
 
 
 class ArbitrageBalancer(ScriptStrategyBase):
@@ -39,32 +47,104 @@ class ArbitrageBalancer(ScriptStrategyBase):
     order_amount = Decimal("1")  # Replace with your desired order amount
     slippage_buffer = Decimal("0.01")  # 1% slippage tolerance
     minimum_profitability = Decimal("0.0005")  # Minimum profitability threshold (e.g., 0.05%)
+    api_price_url = None  # Optional price API endpoint returning {"price": ...}; the fixed rate is used when unset
+    api_price_refresh_interval = 30.0  # Seconds between background api_price refreshes
+    api_price_retry_interval = 1.0  # Seconds between retries until the first api_price arrives
+    api_price_timeout = 5.0  # Seconds to wait for the price API
+    api_price_max_age = 3 * api_price_refresh_interval  # Seconds after which the api_price is too old to trade on
     markets = {connector_chain_network: {trading_pair}}
-    on_going_task = False
+    price_cache_ttl = 1.5  # Seconds a DEX quote is reused; ticks within the same block see the same price
+    balance_cache_ttl = 2.0  # Seconds a fetched balance is reused before hitting the Gateway again
+    price_timeout = 1.5  # Seconds to wait for a Gateway price quote
+    trade_timeout = 5.0  # Seconds to wait for the Gateway to submit a trade
+    balance_timeout = 2.0  # Seconds to wait for a Gateway balance read
+    tx_status_timeout = 2.0  # Seconds to wait for a single transaction status read
+    # Approximate block time (seconds) per (chain, network), waited once if the first status read is still pending
+    tx_block_times = {("ethereum", "mainnet"): 12.0, ("polygon", "mainnet"): 2.0}
+    tx_poll_initial_delay = 0.5  # First wait (seconds) between transaction status polls
+    tx_poll_backoff = 1.5  # Multiplier applied to the poll wait after every pending status
+    tx_poll_max_delay = 4.0  # Upper bound (seconds) on the poll wait
+    tx_poll_timeout = 180.0  # Seconds to wait for a transaction before giving up
 
     def __init__(self, connectors: list, config: ClientConfigAdapter = None):
         super().__init__(connectors, config)
-        self.api_price = 0  # initialize to zero and fetch in on_tick
-        self.dex_price = 0  # initialize to zero and fetch in on_tick
+        self.api_price = Decimal(0)  # initialize to zero and refresh in api_price_loop
+        self.dex_price = Decimal(0)  # initialize to zero and fetch in arbitrage_task
+        self._api_price_f = 0.0  # float copy of api_price for the deviation check
+        self._task = None  # in-flight arbitrage_task, if any
+        self._trading_paused_until = 0.0  # monotonic time before which no new trade is submitted
+        # The client keeps one shared aiohttp session (and connection pool) for the whole bot
+        self._gw = GatewayHttpClient.get_instance()
+        self._wallet_index: Optional[Dict[Tuple[str, str, str], str]] = None
+        self._wallet_lock = asyncio.Lock()
+        self._price_cache: Dict[Tuple[str, str, str, TradeType], Tuple[float, Decimal]] = {}
+        self._balance_cache: Dict[Tuple[str, str, str], Tuple[float, dict]] = {}
+
+        base, quote = self.trading_pair.split("-")
+        connector, chain, network = self.connector_chain_network.split("_")
+        self._params = TradeParams(chain=chain, network=network, connector=connector, base=base, quote=quote)
+        self._price_key = (base, quote, str(self.order_amount), _BUY)
+
+        # Limit price multipliers and the profitability threshold used by every decision
+        self._buy_mult = Decimal("1") + self.slippage_buffer
+        self._sell_mult = Decimal("1") - self.slippage_buffer
+        self._min_profit_float = float(self.minimum_profitability)
+
+        # The api_price moves far slower than ticks, so it is refreshed off the tick path
+        self._api_price_ready = asyncio.Event()
+        self._api_price_ts = 0.0  # monotonic time of the last successful api_price refresh
+        self._api_price_task = safe_ensure_future(self.api_price_loop())
 
     def on_tick(self):
         """
         Executes every tick (e.g. 1s)
         """
-        if not self.on_going_task:
-            # Update the api_price before calling the async_task method
-            self.update_api_price()
-            self.on_going_task = True
+        # Drop the tick while the previous arbitrage round is still in flight
+        if self._task and not self._task.done():
+            return
 
-            safe_ensure_future(self.arbitrage_task())
-            self.on_going_task = False
+        self._task = safe_ensure_future(self.arbitrage_task())
 
-    def update_api_price(self):
+    async def on_stop(self):
         """
-        Method to update the api_price. Replace this with actual API call logic.
+        Stops the background api_price refresh and any in-flight arbitrage round, so no trade is submitted after stop.
+        """
+        self._api_price_task.cancel()
+        if self._task is not None:
+            self._task.cancel()
+
+    async def api_price_loop(self):
         """
-        # Placeholder for API call to get the fixed rate
-        # Example: fixed_rate = await fetch_fixed_rate_from_api()
+        Refreshes the api_price every `api_price_refresh_interval` seconds.
+        """
+        while True:
+            try:
+                api_price = await self.update_api_price()
+                self.api_price = api_price
+                self._api_price_f = float(api_price)
+                self._api_price_ts = time.monotonic()
+                self._api_price_ready.set()
+            except Exception as e:
+                self.logger().error("Error updating API price: %s", e, exc_info=True)
+            # Arbitrage rounds wait on the first price, so retry quickly until one has arrived
+            if self._api_price_ready.is_set():
+                await asyncio.sleep(self.api_price_refresh_interval)
+            else:
+                await asyncio.sleep(self.api_price_retry_interval)
+
+    async def update_api_price(self):
+        """
+        Fetches the api_price from `api_price_url`, falling back to the fixed rate when no API is configured.
+        """
+        if self.api_price_url is not None:
+            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.api_price_timeout)) as session:
+                async with session.get(self.api_price_url) as response:
+                    response.raise_for_status()
+                    price_data = await response.json()
+            api_price = Decimal(str(price_data["price"]))
+            if self.logger().isEnabledFor(logging.INFO):
+                self.logger().info("Updated API Price: %s", api_price)
+            return api_price
 
         # Assuming the fixed rate is the price of WETH in terms of DAI
         # For demonstration, let's use a static value
@@ -72,179 +152,296 @@ class ArbitrageBalancer(ScriptStrategyBase):
         # 1 WETH = 1/0.00029470706118118590121419309206649 DAI
 
         # so DAI/WETH rate is:
-        self.api_price = Decimal(0.00029470706118118590121419309206649)
-        self.logger().info(f"Updated API Price (Fixed Rate): {self.api_price}")
+        api_price = Decimal("0.00029470706118118590121419309206649")
+        if self.logger().isEnabledFor(logging.INFO):
+            self.logger().info("Updated API Price (Fixed Rate): %s", api_price)
+        return api_price
 
     async def arbitrage_task(self):
         """
         Main task to execute arbitrage logic.
         """
         try:
-            base, quote = self.trading_pair.split("-")
-            connector, chain, network = self.connector_chain_network.split("_")
-            params = TradeParams(chain=chain, network=network, connector=connector, base=base, quote=quote)
+            params = self._params
+
+            # Only the first round waits; afterwards the latest refreshed api_price is used as is
+            await self._api_price_ready.wait()
+
+            # Refreshes that fail keep the last price around, so don't decide a direction on one of unknown age
+            api_price_age = time.monotonic() - self._api_price_ts
+            if api_price_age > self.api_price_max_age:
+                self.logger().warning("API price is %.0fs old, skipping arbitrage check.", api_price_age)
+                return
+
+            # Fetch DEX price from Gateway; a slow quote just skips this tick
+            try:
+                self.dex_price = await self.fetch_dex_price(params=params)
+            except asyncio.TimeoutError:
+                self.logger().warning("DEX price fetch timed out after %ss.", self.price_timeout)
+                return
+            if self.logger().isEnabledFor(logging.INFO):
+                self.logger().info("DEX Price: %s", self.dex_price)
 
-            # Fetch DEX price from Gateway
-            self.dex_price = await self.fetch_dex_price(params=params)
-            self.logger().info(f"DEX Price: {self.dex_price}")
+            # Nothing to compare against until both prices have been fetched
+            if not self._api_price_f or not self.dex_price:
+                self.logger().info("Prices not available yet, skipping arbitrage check.")
+                return
 
-            # Determine trade direction and execute
-            await self.determine_and_execute_trade(params=params)
-            self.logger().info("determine_and_execute_trade completed....")
+            # Determine trade direction here, straight after the price fetch, and execute
+            # WETH/DAI deviation = (dex_price - api_price) / api_price
+            # If deviation is positive, it means the DEX price of WETH is higher than the API price, so we should buy WETH on the DEX (SELL DAI for WETH).
+            # If deviation is negative, it means the DEX price of WETH is lower than the API price, so we should sell WETH on the DEX (BUY DAI with WETH).
+            # if api_price is the rate of 1 DAI in terms of WETH then, if the deviation is positive then buy else sell
+            # The deviation is only thresholded and logged, so float precision is enough here
+            dex = float(self.dex_price)
+            api = self._api_price_f
+            deviation = (dex - api) / api
+            if self.logger().isEnabledFor(logging.INFO):
+                self.logger().info("Price Deviation: %.2f%%", deviation * 100)
+
+            if abs(deviation) > self._min_profit_float:
+                self.logger().info("Deviation ensures minimum profitibilitty...")
+                if deviation > 0:
+                    self.logger().info("Deviation is positive, executing BUY WETH-DAI order.")
+                    trade_type = _SELL  # Sell DAI for WETH
+                else:
+                    self.logger().info("Deviation is negative, executing SELL WETH-DAI order.")
+                    trade_type = _BUY  # Buy DAI with WETH
+
+                await self.determine_and_execute_trade(params=params, trade_type=trade_type)
+                self.logger().info("determine_and_execute_trade completed....")
+            else:
+                self.logger().info("No profitable arbitrage opportunity found.")
 
         except Exception as e:
-            self.logger().error(f"Error in arbitrage_task: {e}", exc_info=True)
+            self.logger().error("Error in arbitrage_task: %s", e, exc_info=True)
+        finally:
+            self._task = None
 
     async def fetch_dex_price(self, params: TradeParams):
         """
-        Fetches the current DEX price for the trading pair.
+        Fetches the current DEX price for the trading pair, reusing quotes younger than `price_cache_ttl`.
         """
-        price_data = await GatewayHttpClient.get_instance().get_price(
-            params.chain, params.network, params.connector, params.base, params.quote, self.order_amount, TradeType.BUY
+        key = self._price_key
+        cached = self._price_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.price_cache_ttl:
+            return cached[1]
+
+        price_data = await asyncio.wait_for(
+            self._gw.get_price(
+                params.chain,
+                params.network,
+                params.connector,
+                params.base,
+                params.quote,
+                self.order_amount,
+                _BUY,
+            ),
+            timeout=self.price_timeout,
         )
-        return Decimal(price_data["price"])
+        price = Decimal(price_data["price"])
+        self._price_cache[key] = (time.monotonic(), price)
+        return price
 
-    async def determine_and_execute_trade(self, params: TradeParams):
+    async def determine_and_execute_trade(self, params: TradeParams, trade_type: TradeType):
         """
-        Determines the trade direction based on profitability and executes the trade.
+        Determines the limit price for a profitable trade direction and executes the trade.
         """
-        trade_type = self.calculate_trade_direction()
-
-        if trade_type:
-            self.logger().info(f"Profitable trade detected: {trade_type.name}")
+        self.logger().info("Profitable trade detected: %s", trade_type.name)
 
-            # Fetch wallet address and check balances before trade
-            params.address = await self.get_wallet_address(params.chain, params.network, params.connector)
-            if not params.address:
-                return
-
-            await self.get_balance(params=params)
+        if time.monotonic() < self._trading_paused_until:
+            self.logger().info("Trading paused after a timed out trade submission, skipping trade.")
+            return
 
-            if trade_type == TradeType.BUY:
-                limit_price = self.dex_price * (1 + self.slippage_buffer)
-            else:
-                limit_price = self.dex_price * (1 - self.slippage_buffer)
+        # Fetch wallet address and check balances before trade. These stay sequential: the balance read needs
+        # the address, and once the connections are cached the lookup is a dict get with nothing to overlap.
+        address = await self.get_wallet_address(params.chain, params.network, params.connector)
+        if not address:
+            return
 
-            await self.execute_trade(
-                params=params,
-                trade_type=trade_type,
-                limit_price=limit_price,
-            )
+        await self.get_balance(params=params, address=address)
 
-    def calculate_trade_direction(self):
-        """
-        Calculates the direction of trade based on price deviation and minimum profitability.
-        Returns None if no profitable trade is found.
-        """
-        # WETH/DAI deviation = (dex_price - api_price) / api_price
-        # If deviation is positive, it means the DEX price of WETH is higher than the API price, so we should buy WETH on the DEX (SELL DAI for WETH).
-        # If deviation is negative, it means the DEX price of WETH is lower than the API price, so we should sell WETH on the DEX (BUY DAI with WETH).
-        # if api_price is the rate of 1 DAI in terms of WETH then, if the deviation is positive then buy else sell
-        deviation = (self.dex_price - self.api_price) / self.api_price
-        self.logger().info(f"Price Deviation: {deviation * 100:.2f}%")
-
-        if abs(deviation) > float(self.minimum_profitability):
-            self.logger().info("Deviation ensures minimum profitibilitty...")
-            if deviation > 0:
-                self.logger().info("Deviation is positive, executing BUY WETH-DAI order.")
-                return TradeType.SELL  # Sell DAI for WETH
-            else:
-                self.logger().info("Deviation is negative, executing SELL WETH-DAI order.")
-                return TradeType.BUY  # Buy DAI with WETH
+        if trade_type is _BUY:
+            limit_price = self.dex_price * self._buy_mult
         else:
-            self.logger().info("No profitable arbitrage opportunity found.")
-            return None
+            limit_price = self.dex_price * self._sell_mult
+
+        await self.execute_trade(
+            params=params,
+            address=address,
+            trade_type=trade_type,
+            limit_price=limit_price,
+        )
 
     async def get_wallet_address(self, chain, network, connector):
         """
         Fetches the wallet address for the given chain, network, and connector.
+        The gateway connections are loaded once and cached until reset_config() is called.
         """
-        gateway_connections_conf = GatewayConnectionSetting.load()
-        if len(gateway_connections_conf) < 1:
-            self.notify("No existing wallet.\n")
-            return
-
-        wallet = [
-            w
-            for w in gateway_connections_conf
-            if w["chain"] == chain and w["connector"] == connector and w["network"] == network
-        ]
-
-        if not wallet:
+        if self._wallet_index is None:
+            async with self._wallet_lock:
+                if self._wallet_index is None:
+                    gateway_connections_conf = GatewayConnectionSetting.load()
+                    if len(gateway_connections_conf) < 1:
+                        self.notify("No existing wallet.\n")
+                        return
+
+                    # Built in reverse so the first matching connection wins, as the original list scan did
+                    self._wallet_index = {
+                        (w["chain"], w["connector"], w["network"]): w["wallet_address"]
+                        for w in reversed(gateway_connections_conf)
+                    }
+
+        wallet_address = self._wallet_index.get((chain, connector, network))
+        if not wallet_address:
             self.notify(f"No wallet found for {chain}_{connector}_{network}.\n")
             return None
 
-        return wallet[0]["wallet_address"]
+        return wallet_address
+
+    def reset_config(self):
+        """
+        Drops the cached gateway connections so the next lookup reloads them.
+        """
+        self._wallet_index = None
 
-    async def execute_trade(self, params: TradeParams, trade_type: TradeType, limit_price: Decimal):
+    async def execute_trade(self, params: TradeParams, address: str, trade_type: TradeType, limit_price: Decimal):
         """
         Executes the trade via Gateway.
         """
-        self.logger().info(
-            f"Executing trade [ connector: {params.connector}, base: {params.base}, quote: {params.quote}, amount: {self.order_amount}, side: {trade_type.name}, price: {limit_price} ]"
-        )
-        try:
-            trade_data = await GatewayHttpClient.get_instance().amm_trade(
-                params.chain,
-                params.network,
+        if self.logger().isEnabledFor(logging.INFO):
+            self.logger().info(
+                "Executing trade [ connector: %s, base: %s, quote: %s, amount: %s, side: %s, price: %s ]",
                 params.connector,
-                params.address,
                 params.base,
                 params.quote,
-                trade_type,
                 self.order_amount,
+                trade_type.name,
                 limit_price,
             )
+        try:
+            try:
+                trade_data = await asyncio.wait_for(
+                    self._gw.amm_trade(
+                        params.chain,
+                        params.network,
+                        params.connector,
+                        address,
+                        params.base,
+                        params.quote,
+                        trade_type,
+                        self.order_amount,
+                        limit_price,
+                    ),
+                    timeout=self.trade_timeout,
+                )
+            except asyncio.TimeoutError:
+                # The Gateway may still broadcast the trade, and the next tick would see the same deviation and
+                # submit it again. Pause trading for tx_poll_timeout, the longest we would wait for a submitted
+                # trade to confirm, so a trade that did go out lands (and moves the price) before we retry.
+                self._trading_paused_until = time.monotonic() + self.tx_poll_timeout
+                self.logger().warning(
+                    "Trade submission timed out after %ss, pausing trading for %ss.",
+                    self.trade_timeout,
+                    self.tx_poll_timeout,
+                )
+                self.invalidate_balance(address)
+                self._price_cache.pop(self._price_key, None)
+                return
             tx_hash = trade_data["txHash"]
-            self.logger().info(f"Trade submitted. Transaction Hash: {tx_hash}")
+            self.logger().info("Trade submitted. Transaction Hash: %s", tx_hash)
+
+            # Balances and the pool price change once the trade lands, so the next reads must be fresh
+            self.invalidate_balance(address)
+            self._price_cache.pop(self._price_key, None)
 
             # Poll for transaction confirmation
             await self.poll_transaction(params.chain, params.network, tx_hash)
 
             # Print resulting balances
-            await self.get_balance(params=params)
+            await self.get_balance(params=params, address=address)
 
             self.logger().info("Trade execution completed.")
 
         except Exception as e:
-            self.logger().error(f"Error executing trade: {e}", exc_info=True)
+            self.logger().error("Error executing trade: %s", e, exc_info=True)
 
-    async def get_balance(self, params: TradeParams):
+    async def get_balance(self, params: TradeParams, address: str):
         """
-        Uses /chain/balance to get account balance
+        Uses /chain/balance to get account balance, reusing results younger than `balance_cache_ttl`
         """
+        key = (address, params.base, params.quote)
+        cached = self._balance_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.balance_cache_ttl:
+            return cached[1]
 
         self.logger().info(
-            f"Fetching balances [ address: {params.address}, base: {params.base}, quote: {params.quote} ]"
-        )
-        balance_data = await GatewayHttpClient.get_instance().get_balances(
-            params.chain, params.network, params.address, [params.base, params.quote]
+            "Fetching balances [ address: %s, base: %s, quote: %s ]", address, params.base, params.quote
         )
-        self.logger().info(f"Balances for {params.address}: {balance_data['balances']}")
+        try:
+            balance_data = await asyncio.wait_for(
+                self._gw.get_balances(params.chain, params.network, address, [params.base, params.quote]),
+                timeout=self.balance_timeout,
+            )
+        except asyncio.TimeoutError:
+            self.logger().warning("Balance fetch timed out after %ss.", self.balance_timeout)
+            return None
+        balances = balance_data["balances"]
+        self._balance_cache[key] = (time.monotonic(), balances)
+        self.logger().info("Balances for %s: %s", address, balances)
+        return balances
+
+    def invalidate_balance(self, address: str):
+        """
+        Drops every cached balance for the given address
+        """
+        for key in [key for key in self._balance_cache if key[0] == address]:
+            del self._balance_cache[key]
 
     async def poll_transaction(self, chain, network, tx_hash):
         """
-        Polls to see if transaction is executed successfully
+        Polls to see if transaction is executed successfully, giving up after `tx_poll_timeout` seconds
         """
         self.logger().info("Starting poll_transaction...")
+        try:
+            await asyncio.wait_for(self._poll_transaction_status(chain, network, tx_hash), timeout=self.tx_poll_timeout)
+        except asyncio.TimeoutError:
+            self.logger().error("Gave up polling transaction %s after %ss.", tx_hash, self.tx_poll_timeout)
+
+    async def _poll_transaction_status(self, chain, network, tx_hash):
+        """
+        Polls the transaction status with exponential backoff until it leaves the pending states
+        """
+        # The first read happens right away. If it is still pending, the trade can't confirm before the next
+        # block, so the first wait is about one block time on known chains; afterwards the usual backoff applies.
+        delay = self.tx_block_times.get((chain, network), self.tx_poll_initial_delay)
         pending = True
         while pending:
-            self.logger().info(f"Polling transaction status [ txHash: {tx_hash} ]")
+            if self.logger().isEnabledFor(logging.INFO):
+                self.logger().info("Polling transaction status [ txHash: %s ]", tx_hash)
             try:
-                poll_data = await GatewayHttpClient.get_instance().get_transaction_status(chain, network, tx_hash)
+                poll_data = await asyncio.wait_for(
+                    self._gw.get_transaction_status(chain, network, tx_hash), timeout=self.tx_status_timeout
+                )
                 tx_status = poll_data.get("txStatus")
                 if tx_status == 1:
-                    self.logger().info(f"Trade with transaction hash {tx_hash} has been executed successfully.")
+                    self.logger().info("Trade with transaction hash %s has been executed successfully.", tx_hash)
                     pending = False
                 elif tx_status in [-1, 0, 2]:
-                    self.logger().info(f"Trade is pending confirmation, Transaction hash: {tx_hash}")
-                    await asyncio.sleep(self.task_cooldown)
+                    self.logger().info("Trade is pending confirmation, Transaction hash: %s", tx_hash)
+                    await asyncio.sleep(delay)
+                    delay = min(delay * self.tx_poll_backoff, self.tx_poll_max_delay)
                 else:
-                    self.logger().info(f"Unknown txStatus: {tx_status}")
-                    self.logger().info(f"{poll_data}")
+                    self.logger().info("Unknown txStatus: %s", tx_status)
+                    self.logger().info("%s", poll_data)
                     pending = False
+            except asyncio.TimeoutError:
+                # A slow status read is retried; poll_transaction bounds the overall wait
+                self.logger().warning("Transaction status read timed out after %ss.", self.tx_status_timeout)
+                await asyncio.sleep(delay)
+                delay = min(delay * self.tx_poll_backoff, self.tx_poll_max_delay)
             except Exception as e:
-                self.logger().error(f"Error polling transaction: {e}", exc_info=True)
+                self.logger().error("Error polling transaction: %s", e, exc_info=True)
                 pending = False
 
     def cancel_all_orders(self):